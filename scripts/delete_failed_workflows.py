@@ -4,15 +4,28 @@ Delete failed workflow runs from GitHub repository.
 Requires GITHUB_TOKEN environment variable with repo permissions.
 """
 
+import functools
+import math
 import os
-import requests
 import sys
+import threading
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
 
 # Configuration
 REPO_OWNER = "HarleyCoops"
 REPO_NAME = "SeeDream"
 GITHUB_TOKEN = os.environ.get("GITHUB_TOKEN")
+# Concurrent DELETEs; kept low to stay under GitHub's secondary rate limits
+MAX_WORKERS = 10
+MAX_FILTERED_RUNS = 1000
+# On-disk cache of workflow run listings, kept apart from the search script's cache
+HTTP_CACHE_PATH = Path.home() / ".cache" / "seeddream" / "workflow_runs_cache"
+# Pause deletions until the reset once fewer than this many requests remain
+RATE_LIMIT_FLOOR = 50
+MAX_DELETE_ATTEMPTS = 3
 
 if not GITHUB_TOKEN:
     print("Error: GITHUB_TOKEN environment variable not set")
@@ -24,50 +37,141 @@ headers = {
     "Accept": "application/vnd.github.v3+json"
 }
 
+@functools.lru_cache(maxsize=None)
+def _get_session():
+    """Return the shared session, building it on first use.
+    
+    Every call reuses pooled keep-alive connections. Run listings are cached but
+    always revalidated with If-None-Match, so an unchanged page comes back as a
+    304 that doesn't count against the rate limit.
+    """
+    # Imported here so a missing token exits without paying for requests_cache
+    import requests_cache
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    session = requests_cache.CachedSession(
+        str(HTTP_CACHE_PATH),
+        backend="sqlite",
+        expire_after=requests_cache.EXPIRE_IMMEDIATELY,
+        cache_control=False
+    )
+    session.headers.update(headers)
+    session.mount("https://", HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 502, 503, 504],
+            allowed_methods=["GET", "DELETE"],
+            # Return the last response instead of raising so callers can inspect its status
+            raise_on_status=False
+        )
+    ))
+    return session
+
+# Earliest time (epoch seconds) at which any worker may send its next DELETE
+_resume_at = 0.0
+_rate_limit_lock = threading.Lock()
+
+def _fetch_runs_page(status, per_page, page):
+    """Fetch one page of workflow runs, returning (total_count, runs)."""
+    url = f"https://api.github.com/repos/{REPO_OWNER}/{REPO_NAME}/actions/runs"
+    params = {
+        "status": status,
+        "per_page": per_page,
+        "page": page
+    }
+    
+    response = _get_session().get(url, params=params)
+    
+    if response.status_code != 200:
+        print(f"Error fetching runs: {response.status_code} - {response.text}")
+        return 0, []
+        
+    data = response.json()
+    # Keep only the fields this script uses so the large run payloads can be freed
+    runs = [
+        {"id": run["id"], "name": run["name"], "created_at": run["created_at"]}
+        for run in data.get("workflow_runs", [])
+    ]
+    return data.get("total_count", 0), runs
+
 def get_workflow_runs(status="failure", per_page=100):
     """Get workflow runs with specified status."""
-    runs = []
-    page = 1
-    
-    while True:
-        url = f"https://api.github.com/repos/{REPO_OWNER}/{REPO_NAME}/actions/runs"
-        params = {
-            "status": status,
-            "per_page": per_page,
-            "page": page
-        }
-        
-        response = requests.get(url, headers=headers, params=params)
-        
-        if response.status_code != 200:
-            print(f"Error fetching runs: {response.status_code} - {response.text}")
-            break
-            
-        data = response.json()
-        workflow_runs = data.get("workflow_runs", [])
-        
-        if not workflow_runs:
-            break
-            
-        runs.extend(workflow_runs)
-        page += 1
-        
-        # Check if we've fetched all pages
-        if len(workflow_runs) < per_page:
-            break
+    total_count, runs = _fetch_runs_page(status, per_page, 1)
+    
+    # GitHub returns at most 1000 runs for filtered queries
+    last_page = math.ceil(min(total_count, MAX_FILTERED_RUNS) / per_page)
+    if last_page <= 1:
+        return runs
+    
+    # The first page told us how many pages there are, so fetch the rest in parallel
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        pages = executor.map(
+            lambda page: _fetch_runs_page(status, per_page, page)[1],
+            range(2, last_page + 1)
+        )
+        for page_runs in pages:
+            runs.extend(page_runs)
     
     return runs
 
+def _wait_for_rate_limit():
+    """Block until any pause requested by an earlier response has elapsed."""
+    delay = _resume_at - time.time()
+    if delay > 0:
+        time.sleep(delay)
+
+def _update_rate_limit(response):
+    """Pause all workers if GitHub asked us to back off or the quota is nearly spent.
+    
+    Returns True if the response was a rate-limit rejection worth retrying.
+    """
+    global _resume_at
+    retry_after = response.headers.get("Retry-After")
+    remaining = response.headers.get("X-RateLimit-Remaining")
+    reset = response.headers.get("X-RateLimit-Reset")
+    
+    if response.status_code in (403, 429) and retry_after is not None:
+        resume_at = time.time() + float(retry_after)
+    elif remaining is not None and reset is not None and int(remaining) < RATE_LIMIT_FLOOR:
+        resume_at = float(reset)
+    else:
+        return False
+    
+    with _rate_limit_lock:
+        if resume_at > _resume_at:
+            _resume_at = resume_at
+            print(f"\nRate limited, pausing for {max(resume_at - time.time(), 0):.0f}s")
+    
+    return response.status_code in (403, 429)
+
 def delete_workflow_run(run_id):
     """Delete a specific workflow run."""
+    # Deferred like the other requests imports in _get_session
+    from requests import RequestException
+    
     url = f"https://api.github.com/repos/{REPO_OWNER}/{REPO_NAME}/actions/runs/{run_id}"
-    response = requests.delete(url, headers=headers)
     
-    if response.status_code == 204:
-        return True
-    else:
-        print(f"Error deleting run {run_id}: {response.status_code} - {response.text}")
-        return False
+    for _ in range(MAX_DELETE_ATTEMPTS):
+        _wait_for_rate_limit()
+        try:
+            response = _get_session().delete(url)
+        except RequestException as e:
+            # Report it as a failed deletion so the progress loop and counters keep going
+            print(f"Error deleting run {run_id}: {e}")
+            return False
+        throttled = _update_rate_limit(response)
+        
+        if response.status_code == 204:
+            return True
+        if not throttled:
+            break
+    
+    print(f"Error deleting run {run_id}: {response.status_code} - {response.text}")
+    return False
 
 def main():
     print(f"Fetching failed workflow runs for {REPO_OWNER}/{REPO_NAME}...")
@@ -82,12 +186,9 @@ def main():
     
     # Show summary
     print("\nFailed runs by workflow:")
-    workflow_counts = {}
-    for run in failed_runs:
-        workflow_name = run["name"]
-        workflow_counts[workflow_name] = workflow_counts.get(workflow_name, 0) + 1
+    workflow_counts = Counter(run["name"] for run in failed_runs)
     
-    for workflow, count in workflow_counts.items():
+    for workflow, count in workflow_counts.most_common():
         print(f"  - {workflow}: {count} failed runs")
     
     # Ask for confirmation
@@ -101,23 +202,23 @@ def main():
     deleted = 0
     failed = 0
     
-    for i, run in enumerate(failed_runs):
-        run_id = run["id"]
-        workflow_name = run["name"]
-        created_at = run["created_at"]
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {executor.submit(delete_workflow_run, run["id"]): run for run in failed_runs}
         
-        print(f"[{i+1}/{len(failed_runs)}] Deleting run {run_id} from '{workflow_name}' (created: {created_at})...", end="")
-        
-        if delete_workflow_run(run_id):
-            print(" ✓")
-            deleted += 1
-        else:
-            print(" ✗")
-            failed += 1
-        
-        # Rate limiting - GitHub allows 1000 requests per hour
-        if (i + 1) % 10 == 0:
-            time.sleep(1)  # Brief pause every 10 deletions
+        for i, future in enumerate(as_completed(futures)):
+            run = futures[future]
+            run_id = run["id"]
+            workflow_name = run["name"]
+            created_at = run["created_at"]
+            
+            if future.result():
+                status = "✓"
+                deleted += 1
+            else:
+                status = "✗"
+                failed += 1
+            
+            print(f"[{i+1}/{len(failed_runs)}] Run {run_id} from '{workflow_name}' (created: {created_at}) {status}")
     
     print(f"\nDeletion complete: {deleted} deleted, {failed} failed")
 
@@ -7,15 +7,21 @@ including code repositories, papers, and related resources.
 It saves the results to a markdown file with a timestamp.
 """
 
+import io
+import itertools
 import os
 import requests
-import json
-import datetime
+import orjson
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import re
 import logging
-from typing import List, Dict, Any, Optional
+import xml.etree.ElementTree as ET
+from typing import List, Dict, Any, Optional, Tuple
 
 # Configure logging
 logging.basicConfig(
@@ -36,13 +42,158 @@ SEARCH_TERMS = [
     "representation alignment loss SeedDream",
     "Chinese-English bilingual image generation SeedDream",
 ]
+# Lowercased, space-stripped terms for matching candidate text, built once at import
+NORMALIZED_TERMS = tuple(term.lower().replace(" ", "") for term in SEARCH_TERMS)
+NORMALIZED_TERMS_PATTERN = re.compile("|".join(map(re.escape, NORMALIZED_TERMS)))
+# Original spelling to report for each normalized term (the first one, where two collapse together)
+TERM_BY_NORMALIZED = {norm: term for norm, term in reversed(list(zip(NORMALIZED_TERMS, SEARCH_TERMS)))}
 GITHUB_ORGS_TO_CHECK = [
     "ByteDance-Seed",
     "ByteDance",
     "bytedance",
 ]
-ARXIV_QUERY = "SeedDream+3.0+OR+ByteDance+Seed+Team"
+# Repeated org: qualifiers are OR'ed by GitHub search; org names are case-insensitive
+GITHUB_ORG_QUALIFIERS = " ".join(f"org:{org}" for org in dict.fromkeys(org.lower() for org in GITHUB_ORGS_TO_CHECK))
+ARXIV_API_URL = "https://export.arxiv.org/api/query"
+ARXIV_QUERY = "SeedDream 3.0 OR ByteDance Seed Team"
+HUGGINGFACE_API_URL = "https://huggingface.co/api/models"
+# Hugging Face search has no OR syntax but matches substrings of model ids,
+# and every search term contains this one
+HUGGINGFACE_SEARCH_TERM = "SeedDream"
 MAX_RESULTS_PER_SOURCE = 10
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+ARXIV_CHUNK_SIZE = 4096
+ARXIV_NO_RESULTS_PATTERN = re.compile(rb"<opensearch:totalResults[^>]*>\s*0\s*</opensearch:totalResults>")
+
+# GitHub search rejects queries with more than 5 AND/OR/NOT operators or 256 characters
+GITHUB_MAX_QUERY_OPERATORS = 5
+GITHUB_MAX_QUERY_LENGTH = 256
+
+# Concurrent requests per source; each source talks to a single host
+MAX_CONCURRENT_REQUESTS = 5
+# Longest rate-limit reset we are willing to wait out before giving up on a request
+MAX_RATE_LIMIT_WAIT_SECONDS = 60
+SECONDARY_RATE_LIMIT_WAIT_SECONDS = 60
+
+# On-disk HTTP cache for the search APIs; the whole directory is kept between CI runs
+HTTP_CACHE_PATH = Path.home() / ".cache" / "seeddream" / "search_http_cache"
+HTTP_CACHE_EXPIRE_SECONDS = 3600
+
+# Report sections in order: (results key, heading, message when empty)
+REPORT_SECTIONS = [
+    ("github", "GitHub Results", "No GitHub results found."),
+    ("arxiv", "arXiv Papers", "No arXiv papers found."),
+    ("huggingface", "Hugging Face Models", "No Hugging Face models found."),
+    ("web", "Web Results", "No web results found."),
+]
+
+def _atom_text(entry: ET.Element, tag: str) -> str:
+    """Return the stripped text of an Atom child element, or an empty string."""
+    child = entry.find(f"{ATOM_NS}{tag}")
+    if child is None or child.text is None:
+        return ""
+    return child.text.strip()
+
+def _normalized_haystack(name: str, desc: Optional[str]) -> str:
+    """Lowercase and strip spaces from a name/description pair for term matching."""
+    # Join with a newline, which isn't stripped, so a term can't match across the two fields
+    return (name + "\n" + (desc or "")).lower().replace(" ", "")
+
+def _matches_any_term(name: str, desc: Optional[str]) -> bool:
+    """Check whether a name/description pair contains any search term, ignoring case and spaces."""
+    return NORMALIZED_TERMS_PATTERN.search(_normalized_haystack(name, desc)) is not None
+
+def _matched_terms(name: str, desc: Optional[str], fallback: List[str]) -> str:
+    """Describe which search terms a name/description pair contains.
+    
+    Falls back to the terms of the query that returned the result when none appear
+    literally, e.g. because GitHub matched the README or topics instead.
+    """
+    matches = NORMALIZED_TERMS_PATTERN.finditer(_normalized_haystack(name, desc))
+    terms = dict.fromkeys(TERM_BY_NORMALIZED[match.group()] for match in matches)
+    return ", ".join(terms or fallback)
+
+def _github_or_query(terms: List[str], qualifiers: str = "") -> str:
+    """Join terms into a GitHub search query matching any of them as exact phrases."""
+    query = " OR ".join(f'"{term}"' for term in terms)
+    return f"{query} {qualifiers}" if qualifiers else query
+
+def _batch_github_terms(terms: List[str], qualifiers: str = "") -> List[List[str]]:
+    """Group terms into as few OR queries as GitHub's search limits allow."""
+    batches = [[]]
+    for term in terms:
+        candidate = batches[-1] + [term]
+        if batches[-1] and (len(candidate) - 1 > GITHUB_MAX_QUERY_OPERATORS or
+                            len(_github_or_query(candidate, qualifiers)) > GITHUB_MAX_QUERY_LENGTH):
+            batches.append([term])
+        else:
+            batches[-1] = candidate
+    return [batch for batch in batches if batch]
+
+def _md_for_github(item: Dict[str, Any]) -> str:
+    """Render a GitHub repository or code result as a markdown block."""
+    if item['type'] == 'github_code':
+        return (f"### Code: [{item['repo']} / {item['path']}]({item['url']})\n\n"
+                f"**Matched:** {item['search_term']}  \n"
+                "\n---\n\n")
+    
+    matched = f"**Matched:** {item['search_term']}  \n" if 'search_term' in item else ""
+    return (f"### [{item['name']}]({item['url']})\n\n"
+            f"**Description:** {item.get('description', 'No description')}\n\n"
+            f"**Stars:** {item['stars']}  \n"
+            f"**Updated:** {item['updated_at']}  \n"
+            f"{matched}"
+            "\n---\n\n")
+
+def _md_for_arxiv(paper: Dict[str, Any]) -> str:
+    """Render an arXiv paper as a markdown block."""
+    return (f"### [{paper['title']}]({paper['url']})\n\n"
+            f"**Published:** {paper['published']}  \n"
+            f"**Summary:** {paper['summary'][:300]}...  \n\n"
+            "\n---\n\n")
+
+def _md_for_huggingface(model: Dict[str, Any]) -> str:
+    """Render a Hugging Face model as a markdown block."""
+    return (f"### [{model['name']}]({model['url']})\n\n"
+            f"**Downloads:** {model['downloads']}  \n"
+            f"**Likes:** {model['likes']}  \n"
+            f"**Tags:** {', '.join(model['tags'])}  \n"
+            f"**Matched:** {model['search_term']}  \n\n"
+            "\n---\n\n")
+
+def _md_for_web(item: Dict[str, Any]) -> str:
+    """Render a web result as a markdown block."""
+    return (f"### [{item['title']}]({item['url']})\n\n"
+            f"**Source:** {item.get('source', 'Unknown')}  \n"
+            f"**Snippet:** {item.get('snippet', 'No snippet available')}  \n\n"
+            "\n---\n\n")
+
+_MD_RENDERERS = {
+    "github_repo": _md_for_github,
+    "github_org_repo": _md_for_github,
+    "github_code": _md_for_github,
+    "arxiv_paper": _md_for_arxiv,
+    "huggingface_model": _md_for_huggingface,
+}
+
+def _md_for_item(item: Dict[str, Any]) -> str:
+    """Render any result item as a markdown block, dispatching on its type."""
+    return _MD_RENDERERS.get(item.get("type"), _md_for_web)(item)
+
+def _pooled_adapter() -> HTTPAdapter:
+    """Build a keep-alive connection pool that retries transient failures."""
+    return HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 502, 503, 504],
+            allowed_methods=["GET"],
+            # Return the last response instead of raising so callers can inspect its status
+            raise_on_status=False
+        )
+    )
 
 class SeedDreamSearcher:
     """Class to search for SeedDream 3.0 information across various sources."""
@@ -57,98 +208,195 @@ class SeedDreamSearcher:
                 "Accept": "application/vnd.github.v3+json"
             }
         
-        # Create results directory if it doesn't exist
+        # Imported here: requests_cache pulls in sqlite3 and several helpers at import time
+        import requests_cache
+        
+        # Cached session so repeated runs reuse responses and revalidate with ETags.
+        # Auth headers are passed per GitHub call so the token never reaches other hosts.
+        self.session = requests_cache.CachedSession(
+            str(HTTP_CACHE_PATH),
+            backend="sqlite",
+            expire_after=HTTP_CACHE_EXPIRE_SECONDS,
+            cache_control=True,
+            stale_if_error=True
+        )
+        self.session.mount("https://", _pooled_adapter())
+        
+        # Plain session for bodies we want to stream: a CachedSession reads the
+        # whole response into memory before returning, even with stream=True
+        self.stream_session = requests.Session()
+        self.stream_session.mount("https://", _pooled_adapter())
+        
+        # Created on first save, so constructing a searcher touches no files
         self.results_dir = Path("search_results")
-        self.results_dir.mkdir(exist_ok=True)
         
         # Timestamp for this search run
-        self.timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        self.timestamp = time.strftime("%Y-%m-%d_%H-%M-%S")
+        
+    def _sleep_until_reset(self, response: requests.Response) -> bool:
+        """Sleep as directed by rate-limit headers; return True if the request should be retried."""
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None:
+            delay = float(retry_after)
+        elif response.headers.get("X-RateLimit-Remaining") == "0":
+            delay = float(response.headers.get("X-RateLimit-Reset", 0)) - time.time()
+        elif "rate limit" in response.text.lower():
+            # Secondary rate limits may omit both headers; GitHub asks for at least a minute
+            delay = SECONDARY_RATE_LIMIT_WAIT_SECONDS
+        else:
+            return False
+        
+        # Don't stall the whole run on an hour-long primary rate-limit reset
+        if delay > MAX_RATE_LIMIT_WAIT_SECONDS:
+            logger.warning(f"Rate limited for {delay:.0f}s by {response.url}, not retrying")
+            return False
+        
+        logger.info(f"Rate limited by {response.url}, retrying in {max(delay, 0):.0f}s")
+        time.sleep(max(delay, 0))
+        return True
+    
+    def _get(self, url: str, session: Optional[requests.Session] = None, **kwargs) -> requests.Response:
+        """GET a URL, waiting out a 403/429 rate-limit response once if the headers allow.
+        
+        Uses the cached session unless another session is given.
+        """
+        session = session or self.session
+        response = session.get(url, **kwargs)
+        if response.status_code in (403, 429) and self._sleep_until_reset(response):
+            response.close()
+            response = session.get(url, **kwargs)
+        return response
+    
+    def _github_get(self, path: str, params: Dict[str, Any]) -> requests.Response:
+        """GET a GitHub API path with the auth headers and URL-encoded query parameters.
+        
+        GitHub's own max-age=60 would otherwise serve repeat calls from cache unchecked;
+        refresh=True sends If-None-Match every time, and the 304 it usually gets back
+        costs no rate limit.
+        """
+        return self._get(f"{GITHUB_API_URL}{path}", params=params, headers=self.github_headers, refresh=True)
+    
+    def _search_github_repos(self, terms: List[str]) -> List[Dict[str, Any]]:
+        """Search GitHub repositories for any of the given terms in a single query."""
+        results = []
+        query = _github_or_query(terms)
+        limit = MAX_RESULTS_PER_SOURCE * len(terms)
+        try:
+            response = self._github_get(
+                "/search/repositories",
+                {"q": query, "sort": "updated", "order": "desc", "per_page": min(limit, 100)}
+            )
+            if not response.ok:
+                logger.warning(f"GitHub repository search for '{query}' failed: {response.status_code} {response.reason}")
+                return results
+            data = orjson.loads(response.content)
+            
+            if "items" in data:
+                for repo in data["items"][:limit]:
+                    results.append({
+                        "type": "github_repo",
+                        "name": repo["full_name"],
+                        "url": repo["html_url"],
+                        "description": repo["description"],
+                        "stars": repo["stargazers_count"],
+                        "updated_at": repo["updated_at"],
+                        "search_term": _matched_terms(repo["name"], repo["description"], terms)
+                    })
+        except Exception:
+            logger.exception(f"Error searching GitHub repositories for '{query}'")
+        
+        return results
+    
+    def _search_github_org_repos(self, terms: List[str]) -> List[Dict[str, Any]]:
+        """Search the watched organizations' repositories for any of the given terms in a single query."""
+        results = []
+        query = _github_or_query(terms, GITHUB_ORG_QUALIFIERS)
+        try:
+            response = self._github_get(
+                "/search/repositories",
+                {"q": query, "sort": "updated", "order": "desc", "per_page": 100}
+            )
+            if not response.ok:
+                logger.warning(f"GitHub organization search for '{query}' failed: {response.status_code} {response.reason}")
+                return results
+            data = orjson.loads(response.content)
+            
+            for repo in data.get("items", []):
+                results.append({
+                    "type": "github_org_repo",
+                    "name": repo["full_name"],
+                    "url": repo["html_url"],
+                    "description": repo["description"],
+                    "stars": repo["stargazers_count"],
+                    "updated_at": repo["updated_at"],
+                    "organization": repo["owner"]["login"]
+                })
+        except Exception:
+            logger.exception(f"Error searching organization repositories for '{query}'")
+        
+        return results
+    
+    def _search_github_code(self, terms: List[str]) -> List[Dict[str, Any]]:
+        """Search GitHub code for any of the given terms in a single query."""
+        results = []
+        query = _github_or_query(terms)
+        limit = MAX_RESULTS_PER_SOURCE * len(terms)
+        try:
+            response = self._github_get(
+                "/search/code",
+                {"q": query, "sort": "indexed", "order": "desc", "per_page": min(limit, 100)}
+            )
+            if not response.ok:
+                logger.warning(f"GitHub code search for '{query}' failed: {response.status_code} {response.reason}")
+                return results
+            data = orjson.loads(response.content)
+            
+            if "items" in data:
+                for item in data["items"][:limit]:
+                    results.append({
+                        "type": "github_code",
+                        "repo": item["repository"]["full_name"],
+                        "path": item["path"],
+                        "url": item["html_url"],
+                        "search_term": _matched_terms(item["repository"]["full_name"], item["path"], terms)
+                    })
+        except Exception:
+            logger.exception(f"Error searching GitHub code for '{query}'")
         
+        return results
+    
     def search_github(self) -> List[Dict[str, Any]]:
         """Search GitHub for SeedDream 3.0 repositories and code."""
         logger.info("Searching GitHub for SeedDream 3.0...")
         results = []
         
-        # Search repositories
-        for term in SEARCH_TERMS:
-            try:
-                encoded_term = term.replace(" ", "+")
-                url = f"{GITHUB_API_URL}/search/repositories?q={encoded_term}&sort=updated&order=desc"
-                response = requests.get(url, headers=self.github_headers)
-                response.raise_for_status()
-                data = response.json()
-                
-                if "items" in data:
-                    for repo in data["items"][:MAX_RESULTS_PER_SOURCE]:
-                        results.append({
-                            "type": "github_repo",
-                            "name": repo["full_name"],
-                            "url": repo["html_url"],
-                            "description": repo["description"],
-                            "stars": repo["stargazers_count"],
-                            "updated_at": repo["updated_at"],
-                            "search_term": term
-                        })
-                
-                # Respect GitHub API rate limits
-                time.sleep(2)
-            except Exception as e:
-                logger.error(f"Error searching GitHub repositories for '{term}': {e}")
-        
-        # Check specific organizations
-        for org in GITHUB_ORGS_TO_CHECK:
-            try:
-                url = f"{GITHUB_API_URL}/orgs/{org}/repos?sort=updated&direction=desc"
-                response = requests.get(url, headers=self.github_headers)
-                response.raise_for_status()
-                repos = response.json()
-                
-                for repo in repos:
-                    # Check if repo name or description contains any of our search terms
-                    repo_text = f"{repo['name']} {repo.get('description', '')}".lower()
-                    if any(term.lower().replace(" ", "") in repo_text.replace(" ", "") for term in SEARCH_TERMS):
-                        results.append({
-                            "type": "github_org_repo",
-                            "name": repo["full_name"],
-                            "url": repo["html_url"],
-                            "description": repo["description"],
-                            "stars": repo["stargazers_count"],
-                            "updated_at": repo["updated_at"],
-                            "organization": org
-                        })
-                
-                # Respect GitHub API rate limits
-                time.sleep(2)
-            except Exception as e:
-                logger.error(f"Error checking repositories for organization '{org}': {e}")
-        
-        # Search code - only if we have a personal access token (not the default GITHUB_TOKEN)
-        # The default GITHUB_TOKEN in Actions cannot search code across all of GitHub
-        if self.github_token and not os.environ.get("GITHUB_ACTIONS"):
-            for term in SEARCH_TERMS[:3]:  # Limit to first few terms to avoid rate limiting
-                try:
-                    encoded_term = term.replace(" ", "+")
-                    url = f"{GITHUB_API_URL}/search/code?q={encoded_term}&sort=indexed&order=desc"
-                    response = requests.get(url, headers=self.github_headers)
-                    response.raise_for_status()
-                    data = response.json()
-                    
-                    if "items" in data:
-                        for item in data["items"][:MAX_RESULTS_PER_SOURCE]:
-                            results.append({
-                                "type": "github_code",
-                                "repo": item["repository"]["full_name"],
-                                "path": item["path"],
-                                "url": item["html_url"],
-                                "search_term": term
-                            })
-                    
-                    # Respect GitHub API rate limits
-                    time.sleep(5)  # Longer sleep for code search as it's more rate-limited
-                except Exception as e:
-                    logger.error(f"Error searching GitHub code for '{term}': {e}")
-        else:
-            logger.info("Skipping code search - requires personal access token with broader permissions")
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+            # Repos can be returned by more than one batched query; list each once per result type
+            seen = set()
+            
+            # Search repositories, a few terms per query
+            for batch_results in executor.map(self._search_github_repos, _batch_github_terms(SEARCH_TERMS)):
+                for repo in batch_results:
+                    if (repo["type"], repo["name"]) not in seen:
+                        seen.add((repo["type"], repo["name"]))
+                        results.append(repo)
+            
+            # Check specific organizations, filtered server-side with org: qualifiers
+            org_batches = _batch_github_terms(SEARCH_TERMS, GITHUB_ORG_QUALIFIERS)
+            for batch_results in executor.map(self._search_github_org_repos, org_batches):
+                for repo in batch_results:
+                    if (repo["type"], repo["name"]) not in seen:
+                        seen.add((repo["type"], repo["name"]))
+                        results.append(repo)
+            
+            # Search code - only if we have a personal access token (not the default GITHUB_TOKEN)
+            # The default GITHUB_TOKEN in Actions cannot search code across all of GitHub
+            if self.github_token and not os.environ.get("GITHUB_ACTIONS"):
+                # Limit to first few terms to avoid rate limiting
+                for batch_results in executor.map(self._search_github_code, _batch_github_terms(SEARCH_TERMS[:3])):
+                    results.extend(batch_results)
+            else:
+                logger.info("Skipping code search - requires personal access token with broader permissions")
         
         return results
     
@@ -158,39 +406,53 @@ class SeedDreamSearcher:
         results = []
         
         try:
-            url = f"http://export.arxiv.org/api/query?search_query={ARXIV_QUERY}&start=0&max_results={MAX_RESULTS_PER_SOURCE}"
-            response = requests.get(url)
-            response.raise_for_status()
-            
-            # Simple regex-based extraction (for demo purposes)
-            # In a production environment, use a proper XML parser
-            entries = re.findall(r'<entry>(.*?)</entry>', response.text, re.DOTALL)
-            
-            for entry in entries:
-                title_match = re.search(r'<title>(.*?)</title>', entry, re.DOTALL)
-                link_match = re.search(r'<id>(.*?)</id>', entry, re.DOTALL)
-                summary_match = re.search(r'<summary>(.*?)</summary>', entry, re.DOTALL)
-                published_match = re.search(r'<published>(.*?)</published>', entry, re.DOTALL)
+            with self._get(
+                ARXIV_API_URL,
+                session=self.stream_session,
+                params={"search_query": ARXIV_QUERY, "start": 0, "max_results": MAX_RESULTS_PER_SOURCE},
+                stream=True
+            ) as response:
+                if not response.ok:
+                    logger.warning(f"arXiv search failed: {response.status_code} {response.reason}")
+                    return results
+                
+                # The uncached session leaves the body on the socket, so the pull parser
+                # handles (and frees) each entry as its bytes arrive
+                chunks = response.iter_content(chunk_size=ARXIV_CHUNK_SIZE)
+                first = next(chunks, b"")
+                # arXiv puts totalResults in the feed header, so the first chunk is
+                # enough to spot an empty result set; leaving the with block closes
+                # the connection without downloading the rest of the body
+                if ARXIV_NO_RESULTS_PATTERN.search(first):
+                    logger.info("arXiv returned no results")
+                    return results
                 
-                if title_match and link_match:
-                    title = title_match.group(1).strip()
-                    link = link_match.group(1).strip()
-                    summary = summary_match.group(1).strip() if summary_match else ""
-                    published = published_match.group(1).strip() if published_match else ""
-                    
-                    # Check if related to SeedDream
-                    if any(term.lower().replace(" ", "") in title.lower().replace(" ", "") or 
-                           term.lower().replace(" ", "") in summary.lower().replace(" ", "") 
-                           for term in SEARCH_TERMS):
-                        results.append({
-                            "type": "arxiv_paper",
-                            "title": title,
-                            "url": link,
-                            "summary": summary,
-                            "published": published
-                        })
-        except Exception as e:
-            logger.error(f"Error searching arXiv: {e}")
+                parser = ET.XMLPullParser(events=("end",))
+                for chunk in itertools.chain([first], chunks):
+                    parser.feed(chunk)
+                    for _, elem in parser.read_events():
+                        if elem.tag != f"{ATOM_NS}entry":
+                            continue
+                        
+                        title = _atom_text(elem, "title")
+                        link = _atom_text(elem, "id")
+                        summary = _atom_text(elem, "summary")
+                        published = _atom_text(elem, "published")
+                        elem.clear()
+                        
+                        if title and link:
+                            # Check if related to SeedDream
+                            if _matches_any_term(title, summary):
+                                results.append({
+                                    "type": "arxiv_paper",
+                                    "title": title,
+                                    "url": link,
+                                    "summary": summary,
+                                    "published": published
+                                })
+                parser.close()
+        except Exception:
+            logger.exception("Error searching arXiv")
         
         return results
     
@@ -199,28 +461,28 @@ class SeedDreamSearcher:
         logger.info("Searching Hugging Face for SeedDream 3.0 models...")
         results = []
         
-        for term in SEARCH_TERMS:
-            try:
-                encoded_term = term.replace(" ", "%20")
-                url = f"https://huggingface.co/api/models?search={encoded_term}"
-                response = requests.get(url)
-                response.raise_for_status()
-                models = response.json()
-                
-                for model in models[:MAX_RESULTS_PER_SOURCE]:
-                    results.append({
-                        "type": "huggingface_model",
-                        "name": model.get("modelId", ""),
-                        "url": f"https://huggingface.co/{model.get('modelId', '')}",
-                        "downloads": model.get("downloads", 0),
-                        "likes": model.get("likes", 0),
-                        "tags": model.get("tags", []),
-                        "search_term": term
-                    })
-                
-                time.sleep(1)
-            except Exception as e:
-                logger.error(f"Error searching Hugging Face for '{term}': {e}")
+        try:
+            response = self._get(
+                HUGGINGFACE_API_URL,
+                params={"search": HUGGINGFACE_SEARCH_TERM, "limit": MAX_RESULTS_PER_SOURCE}
+            )
+            if not response.ok:
+                logger.warning(f"Hugging Face search for '{HUGGINGFACE_SEARCH_TERM}' failed: {response.status_code} {response.reason}")
+                return results
+            models = orjson.loads(response.content)
+            
+            for model in models[:MAX_RESULTS_PER_SOURCE]:
+                results.append({
+                    "type": "huggingface_model",
+                    "name": model.get("modelId", ""),
+                    "url": f"https://huggingface.co/{model.get('modelId', '')}",
+                    "downloads": model.get("downloads", 0),
+                    "likes": model.get("likes", 0),
+                    "tags": model.get("tags", []),
+                    "search_term": HUGGINGFACE_SEARCH_TERM
+                })
+        except Exception:
+            logger.exception(f"Error searching Hugging Face for '{HUGGINGFACE_SEARCH_TERM}'")
         
         return results
     
@@ -237,13 +499,20 @@ class SeedDreamSearcher:
         """Run all search methods and compile results."""
         logger.info("Starting comprehensive search for SeedDream 3.0...")
         
-        results = {
-            "github": self.search_github(),
-            "arxiv": self.search_arxiv(),
-            "huggingface": self.search_huggingface(),
-            "web": self.search_web(),
-            "timestamp": self.timestamp
-        }
+        # Each source talks to a different host, so run them side by side
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            github = executor.submit(self.search_github)
+            arxiv = executor.submit(self.search_arxiv)
+            huggingface = executor.submit(self.search_huggingface)
+            web = executor.submit(self.search_web)
+            
+            results = {
+                "github": github.result(),
+                "arxiv": arxiv.result(),
+                "huggingface": huggingface.result(),
+                "web": web.result(),
+                "timestamp": self.timestamp
+            }
         
         logger.info(f"Search completed. Found: {len(results['github'])} GitHub results, "
                    f"{len(results['arxiv'])} arXiv papers, "
@@ -251,81 +520,49 @@ class SeedDreamSearcher:
         
         return results
     
+    def _render(self, results: Dict[str, List[Dict[str, Any]]]) -> Tuple[str, bytes]:
+        """Render the results as a markdown report and as JSON bytes.
+        
+        The markdown is built in one pass over the sections; the JSON is serialized
+        straight from the same objects by orjson, without an intermediate copy.
+        """
+        buf = io.StringIO()
+        buf.write(f"# SeedDream 3.0 Search Results\n\n")
+        buf.write(f"**Search Date:** {self.timestamp.replace('_', ' ')}\n\n")
+        
+        for key, heading, empty_message in REPORT_SECTIONS:
+            items = results[key]
+            buf.write(f"## {heading} ({len(items)} found)\n\n")
+            if not items:
+                buf.write(f"{empty_message}\n\n")
+            for item in items:
+                buf.write(_md_for_item(item))
+        
+        # Comparison with previous results
+        buf.write("## Changes Since Last Search\n\n")
+        buf.write("*Comparison with previous results would be shown here.*\n\n")
+        
+        # Conclusion
+        buf.write("## Conclusion\n\n")
+        buf.write("This report was automatically generated by the SeedDream 3.0 search script.\n")
+        buf.write("For more information, check the JSON file for complete data.\n")
+        
+        return buf.getvalue(), orjson.dumps(results, option=orjson.OPT_INDENT_2)
+    
     def save_results(self, results: Dict[str, List[Dict[str, Any]]]) -> str:
         """Save search results to JSON and markdown files."""
-        # Save as JSON
+        try:
+            self.results_dir.mkdir()
+        except FileExistsError:
+            pass
+        
+        markdown, json_bytes = self._render(results)
+        
         json_path = self.results_dir / f"seeddream_search_{self.timestamp}.json"
-        with open(json_path, 'w') as f:
-            json.dump(results, f, indent=2)
+        json_path.write_bytes(json_bytes)
         
-        # Save as Markdown
         md_path = self.results_dir / f"seeddream_search_{self.timestamp}.md"
-        with open(md_path, 'w') as f:
-            f.write(f"# SeedDream 3.0 Search Results\n\n")
-            f.write(f"**Search Date:** {self.timestamp.replace('_', ' ')}\n\n")
-            
-            # GitHub results
-            f.write(f"## GitHub Results ({len(results['github'])} found)\n\n")
-            if results['github']:
-                for item in results['github']:
-                    if item['type'] == 'github_repo' or item['type'] == 'github_org_repo':
-                        f.write(f"### [{item['name']}]({item['url']})\n\n")
-                        f.write(f"**Description:** {item.get('description', 'No description')}\n\n")
-                        f.write(f"**Stars:** {item['stars']}  \n")
-                        f.write(f"**Updated:** {item['updated_at']}  \n")
-                        if 'search_term' in item:
-                            f.write(f"**Matched:** {item['search_term']}  \n")
-                        f.write("\n---\n\n")
-                    elif item['type'] == 'github_code':
-                        f.write(f"### Code: [{item['repo']} / {item['path']}]({item['url']})\n\n")
-                        f.write(f"**Matched:** {item['search_term']}  \n")
-                        f.write("\n---\n\n")
-            else:
-                f.write("No GitHub results found.\n\n")
-            
-            # arXiv results
-            f.write(f"## arXiv Papers ({len(results['arxiv'])} found)\n\n")
-            if results['arxiv']:
-                for paper in results['arxiv']:
-                    f.write(f"### [{paper['title']}]({paper['url']})\n\n")
-                    f.write(f"**Published:** {paper['published']}  \n")
-                    f.write(f"**Summary:** {paper['summary'][:300]}...  \n\n")
-                    f.write("\n---\n\n")
-            else:
-                f.write("No arXiv papers found.\n\n")
-            
-            # Hugging Face results
-            f.write(f"## Hugging Face Models ({len(results['huggingface'])} found)\n\n")
-            if results['huggingface']:
-                for model in results['huggingface']:
-                    f.write(f"### [{model['name']}]({model['url']})\n\n")
-                    f.write(f"**Downloads:** {model['downloads']}  \n")
-                    f.write(f"**Likes:** {model['likes']}  \n")
-                    f.write(f"**Tags:** {', '.join(model['tags'])}  \n")
-                    f.write(f"**Matched:** {model['search_term']}  \n\n")
-                    f.write("\n---\n\n")
-            else:
-                f.write("No Hugging Face models found.\n\n")
-            
-            # Web results
-            f.write(f"## Web Results ({len(results['web'])} found)\n\n")
-            if results['web']:
-                for item in results['web']:
-                    f.write(f"### [{item['title']}]({item['url']})\n\n")
-                    f.write(f"**Source:** {item.get('source', 'Unknown')}  \n")
-                    f.write(f"**Snippet:** {item.get('snippet', 'No snippet available')}  \n\n")
-                    f.write("\n---\n\n")
-            else:
-                f.write("No web results found.\n\n")
-            
-            # Comparison with previous results
-            f.write("## Changes Since Last Search\n\n")
-            f.write("*Comparison with previous results would be shown here.*\n\n")
-            
-            # Conclusion
-            f.write("## Conclusion\n\n")
-            f.write("This report was automatically generated by the SeedDream 3.0 search script.\n")
-            f.write("For more information, check the JSON file for complete data.\n")
+        md_path.write_text(markdown, encoding='utf-8')
         
         logger.info(f"Results saved to {json_path} and {md_path}")
         return str(md_path)